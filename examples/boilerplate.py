@@ -4,14 +4,15 @@ Boilerplate for a standalone ro.py application.
 
 import asyncio
 from roblox import Client
-client = Client()
 
 
 async def main():
     """
     Place your code here.
     """
-    pass
+    async with Client() as client:
+        pass
 
 
-asyncio.get_event_loop().run_until_complete(main())
+if __name__ == "__main__":
+    asyncio.run(main())
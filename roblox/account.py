@@ -7,6 +7,7 @@ Not to be confused with users.py or the Account system.
 
 from datetime import date
 
+from .utilities.requests import json_loads
 from .utilities.shared import ClientSharedObject
 
 
@@ -32,7 +33,7 @@ class AccountProvider:
         birthday_response = await self._shared.requests.get(
             url=self._shared.url_generator.get_url("accountinformation", "v1/birthdate")
         )
-        birthday_data = birthday_response.json()
+        birthday_data = json_loads(birthday_response.content)
         return date(
             month=birthday_data["birthMonth"],
             day=birthday_data["birthDay"],
@@ -7,12 +7,11 @@ This module contains classes intended to parse and deal with data from Roblox as
 from datetime import datetime
 from typing import Union, Optional
 
-from dateutil.parser import parse
-
 from .bases.baseasset import BaseAsset
 from .partials.partialgroup import AssetPartialGroup
 from .partials.partialuser import PartialUser
 from .creatortype import CreatorType
+from .utilities.dates import parse_datetime
 from .utilities.shared import ClientSharedObject
 
 asset_type_names = {
@@ -163,8 +162,8 @@ class EconomyAsset(BaseAsset):
 
         self.icon_image: BaseAsset = BaseAsset(shared=shared, asset_id=data["IconImageAssetId"])
 
-        self.created: datetime = parse(data["Created"])
-        self.updated: datetime = parse(data["Updated"])
+        self.created: datetime = parse_datetime(data["Created"])
+        self.updated: datetime = parse_datetime(data["Updated"])
 
         self.price: Optional[int] = data["PriceInRobux"]
         self.sales: int = data["Sales"]
@@ -6,11 +6,10 @@ This module contains classes intended to parse and deal with data from Roblox ba
 
 from datetime import datetime
 
-from dateutil.parser import parse
-
 from .bases.baseasset import BaseAsset
 from .bases.basebadge import BaseBadge
 from .partials.partialuniverse import PartialUniverse
+from .utilities.dates import parse_datetime
 from .utilities.shared import ClientSharedObject
 
 
@@ -71,8 +70,8 @@ class Badge(BaseBadge):
         self.enabled: bool = data["enabled"]
         self.icon: BaseAsset = BaseAsset(shared=shared, asset_id=data["iconImageId"])
         self.display_icon: BaseAsset = BaseAsset(shared=shared, asset_id=data["displayIconImageId"])
-        self.created: datetime = parse(data["created"])
-        self.updated: datetime = parse(data["updated"])
+        self.created: datetime = parse_datetime(data["created"])
+        self.updated: datetime = parse_datetime(data["updated"])
 
         self.statistics: BadgeStatistics = BadgeStatistics(data=data["statistics"])
         self.awarding_universe: PartialUniverse = PartialUniverse(shared=shared, data=data["awardingUniverse"])
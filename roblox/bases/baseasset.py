@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING
 
 from .baseitem import BaseItem
 from ..resale import AssetResaleData
+from ..utilities.requests import json_loads
 from ..utilities.shared import ClientSharedObject
 
 if TYPE_CHECKING:
@@ -52,5 +53,5 @@ class BaseAsset(BaseItem):
         resale_response = await self._shared.requests.get(
             url=self._shared.url_generator.get_url("economy", f"v1/assets/{self.id}/resale-data")
         )
-        resale_data = resale_response.json()
+        resale_data = json_loads(resale_response.content)
         return AssetResaleData(data=resale_data)
@@ -8,9 +8,8 @@ It also contains the GroupSettings object, which represents a group's settings.
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional, List, Union, TYPE_CHECKING
-
-from dateutil.parser import parse
+from time import monotonic
+from typing import Optional, List, Tuple, Union, TYPE_CHECKING
 
 from .baseitem import BaseItem
 from ..bases.baserole import BaseRole
@@ -18,8 +17,10 @@ from ..members import Member, MemberRelationship
 from ..partials.partialuser import PartialUser, RequestedUsernamePartialUser
 from ..roles import Role
 from ..shout import Shout
+from ..utilities.dates import parse_datetime
 from ..utilities.exceptions import InvalidRole
 from ..utilities.iterators import PageIterator, SortOrder
+from ..utilities.requests import json_loads
 from ..utilities.shared import ClientSharedObject
 from ..wall import WallPost, WallPostRelationship
 
@@ -36,7 +37,7 @@ class JoinRequest(PartialUser):
     def __init__(self, shared: ClientSharedObject, data: dict, group: Union[BaseGroup, int]):
         self._shared: ClientSharedObject = shared
         super().__init__(shared=self._shared, data=data["requester"])
-        self.created: datetime = parse(data["created"])
+        self.created: datetime = parse_datetime(data["created"])
 
         self.group: BaseGroup
 
@@ -73,6 +74,18 @@ class GroupSettings:
         can_change_group_name: Whether the name of this group can be changed.
     """
 
+    __slots__ = (
+        "_shared",
+        "is_approval_required",
+        "is_builders_club_required",
+        "are_enemies_allowed",
+        "are_group_funds_visible",
+        "are_group_games_visible",
+        "is_group_name_change_enabled",
+        "can_change_group_name",
+        "__weakref__"
+    )
+
     def __init__(self, shared: ClientSharedObject, data: dict):
         """
         Arguments:
@@ -90,6 +103,18 @@ class GroupSettings:
         self.can_change_group_name: bool = data["canChangeGroupName"]
 
 
+def _members_handler(shared: ClientSharedObject, data: dict, group: BaseGroup) -> Member:
+    return Member(shared=shared, data=data, group=group)
+
+
+def _wall_posts_handler(shared: ClientSharedObject, data: dict, group: BaseGroup) -> WallPost:
+    return WallPost(shared=shared, data=data, group=group)
+
+
+def _join_requests_handler(shared: ClientSharedObject, data: dict, group: BaseGroup) -> JoinRequest:
+    return JoinRequest(shared=shared, data=data, group=group)
+
+
 class BaseGroup(BaseItem):
     """
     Represents a Roblox group ID.
@@ -100,6 +125,11 @@ class BaseGroup(BaseItem):
         id: The group's ID.
     """
 
+    __slots__ = ("_shared", "_requests", "id", "_group_url", "_roles_cache")
+
+    roles_cache_ttl: float = 60
+    settings_cache_ttl: float = 300
+
     def __init__(self, shared: ClientSharedObject, group_id: int):
         """
         Parameters:
@@ -109,6 +139,8 @@ class BaseGroup(BaseItem):
         self._shared: ClientSharedObject = shared
         self._requests = shared.requests
         self.id: int = group_id
+        self._group_url: str = shared.url_generator.get_url("groups", f"v1/groups/{group_id}")
+        self._roles_cache: Optional[Tuple[float, List[Role]]] = None
 
     async def to_group(self) -> Group:
         """
@@ -122,14 +154,21 @@ class BaseGroup(BaseItem):
     async def get_settings(self) -> GroupSettings:
         """
         Gets all the settings of the selected group
+        Responses are cached for `settings_cache_ttl` seconds.
 
         Returns:
             GroupSettings.
         """
-        settings_response = await self._requests.get(
-            url=self._shared.url_generator.get_url("groups", f"v1/groups/{self.id}/settings"),
-        )
-        settings_data = settings_response.json()
+        settings_url = f"{self._group_url}/settings"
+        settings_data = self._shared.response_cache.get(settings_url)
+
+        if settings_data is None:
+            settings_response = await self._requests.get(
+                url=settings_url,
+            )
+            settings_data = json_loads(settings_response.content)
+            self._shared.response_cache.set(settings_url, settings_data, ttl=self.settings_cache_ttl)
+
         return GroupSettings(
             shared=self._shared,
             data=settings_data
@@ -161,11 +200,15 @@ class BaseGroup(BaseItem):
             "areGroupGamesVisible": are_group_games_visible,
         }
 
+        settings_url = f"{self._group_url}/settings"
+
         await self._requests.patch(
-            url=self._shared.url_generator.get_url("groups", f"v1/groups/{self.id}/settings"),
+            url=settings_url,
             json=settings_data
         )
 
+        self._shared.response_cache.pop(settings_url)
+
     def get_members(self, sort_order: SortOrder = SortOrder.Ascending, limit: int = 10) -> PageIterator:
         """
         Gets all members of a group.
@@ -177,10 +220,11 @@ class BaseGroup(BaseItem):
         """
         return PageIterator(
             shared=self._shared,
-            url=self._shared.url_generator.get_url("groups", f"v1/groups/{self.id}/users"),
+            url=f"{self._group_url}/users",
             sort_order=sort_order,
             limit=limit,
-            handler=lambda shared, data: Member(shared=shared, data=data, group=self)
+            handler=_members_handler,
+            handler_kwargs={"group": self}
         )
 
     def get_member(self, user: Union[int, BaseUser]) -> MemberRelationship:
@@ -207,11 +251,17 @@ class BaseGroup(BaseItem):
         Returns: A member.
         """
 
-        user: RequestedUsernamePartialUser = await self._shared.client.get_user_by_username(
-            username=username,
-            exclude_banned_users=exclude_banned_users,
-            expand=False
-        )
+        cache_key = (username.lower(), exclude_banned_users)
+        user: Optional[RequestedUsernamePartialUser] = self._shared.username_cache.get(cache_key)
+
+        if user is None:
+            user = await self._shared.client.get_user_by_username(
+                username=username,
+                exclude_banned_users=exclude_banned_users,
+                expand=False
+            )
+            if user is not None:
+                self._shared.username_cache.set(cache_key, user)
 
         return MemberRelationship(
             shared=self._shared,
@@ -222,19 +272,32 @@ class BaseGroup(BaseItem):
     async def get_roles(self) -> List[Role]:
         """
         Gets all roles of the group.
+        Roles are cached on this object for `roles_cache_ttl` seconds. Call invalidate_roles to clear the cache.
 
         Returns: List of roles.
         """
+        if self._roles_cache and monotonic() - self._roles_cache[0] < self.roles_cache_ttl:
+            return list(self._roles_cache[1])
+
         roles_response = await self._shared.requests.get(
-            url=self._shared.url_generator.get_url("groups", f"v1/groups/{self.id}/roles")
+            url=f"{self._group_url}/roles"
         )
-        roles_data = roles_response.json()
-        return [Role(
+        roles_data = json_loads(roles_response.content)
+        roles = [Role(
             shared=self._shared,
             data=role_data,
             group=self
         ) for role_data in roles_data["roles"]]
 
+        self._roles_cache = (monotonic(), roles)
+        return list(roles)
+
+    def invalidate_roles(self) -> None:
+        """
+        Clears the cached roles so the next call to get_roles requests them again.
+        """
+        self._roles_cache = None
+
     async def set_role(self, user: BaseUser, role: BaseRole) -> None:
         """
         Sets a users role.
@@ -243,7 +306,7 @@ class BaseGroup(BaseItem):
             role: The new role.
         """
         await self._shared.requests.patch(
-            url=self._shared.url_generator.get_url("groups", f"v1/groups/{self.id}/users/{user.id}"),
+            url=f"{self._group_url}/users/{user.id}",
             json={
                 "roleId": role.id
             }
@@ -269,7 +332,7 @@ class BaseGroup(BaseItem):
         Kicks a user from a group.
         """
         await self._shared.requests.delete(
-            url=self._shared.url_generator.get_url("groups", f"v1/groups/{self.id}/users/{user.id}")
+            url=f"{self._group_url}/users/{user.id}"
         )
 
     def get_wall_posts(self, sort_order: SortOrder = SortOrder.Ascending, limit: int = 10) -> PageIterator:
@@ -286,7 +349,8 @@ class BaseGroup(BaseItem):
             url=self._shared.url_generator.get_url("groups", f"v2/groups/{self.id}/wall/posts"),
             sort_order=sort_order,
             limit=limit,
-            handler=lambda shared, data: WallPost(shared=shared, data=data, group=self)
+            handler=_wall_posts_handler,
+            handler_kwargs={"group": self}
         )
 
     def get_wall_post(self, post_id: int) -> WallPostRelationship:
@@ -309,10 +373,11 @@ class BaseGroup(BaseItem):
         """
         return PageIterator(
             shared=self._shared,
-            url=self._shared.url_generator.get_url("groups", f"v1/groups/{self.id}/join-requests"),
+            url=f"{self._group_url}/join-requests",
             sort_order=sort_order,
             limit=limit,
-            handler=lambda shared, data: JoinRequest(shared=shared, data=data, group=self)
+            handler=_join_requests_handler,
+            handler_kwargs={"group": self}
         )
 
     async def get_join_request(self, user: Union[int, BaseUser]) -> Optional[JoinRequest]:
@@ -321,21 +386,21 @@ class BaseGroup(BaseItem):
         Returns None if the user does not have an active join request.
         """
         join_response = await self._shared.requests.get(
-            url=self._shared.url_generator.get_url("groups", f"v1/groups/{self.id}/join-requests/users/{int(user)}")
+            url=f"{self._group_url}/join-requests/users/{int(user)}"
         )
-        join_data = join_response.json()
-        return join_data and JoinRequest(
+        join_data = json_loads(join_response.content)
+        return JoinRequest(
             shared=self._shared,
             data=join_data,
             group=self
-        ) or None
+        ) if join_data else None
 
     async def accept_user(self, user: Union[int, BaseUser]):
         """
         Accepts a user's request to join this group.
         """
         await self._shared.requests.post(
-            url=self._shared.url_generator.get_url("groups", f"v1/groups/{self.id}/join-requests/users/{int(user)}")
+            url=f"{self._group_url}/join-requests/users/{int(user)}"
         )
 
     async def decline_user(self, user: Union[int, BaseUser]):
@@ -343,7 +408,7 @@ class BaseGroup(BaseItem):
         Declines a user's request to join this group.
         """
         await self._shared.requests.delete(
-            url=self._shared.url_generator.get_url("groups", f"v1/groups/{self.id}/join-requests/users/{int(user)}")
+            url=f"{self._group_url}/join-requests/users/{int(user)}"
         )
 
     async def update_shout(self, message: str) -> Optional[Shout]:
@@ -354,17 +419,17 @@ class BaseGroup(BaseItem):
             message: The new shout message.
         """
         shout_response = await self._requests.patch(
-            url=self._shared.url_generator.get_url("groups", f"v1/groups/{self.id}/status"),
+            url=f"{self._group_url}/status",
             json={
                 "message": message
             }
         )
 
-        shout_data = shout_response.json()
+        shout_data = json_loads(shout_response.content)
 
-        new_shout: Optional[Shout] = shout_data and Shout(
+        new_shout: Optional[Shout] = Shout(
             shared=self._shared,
             data=shout_data
-        ) or None
+        ) if shout_data else None
 
         return new_shout
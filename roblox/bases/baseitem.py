@@ -7,6 +7,9 @@ class BaseItem:
     """
     All bases inherit this class.
     """
+
+    __slots__ = ("__weakref__",)
+
     id = None
 
     def __repr__(self):
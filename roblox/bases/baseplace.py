@@ -5,6 +5,7 @@ This file contains the BasePlace object, which represents a Roblox place ID.
 """
 
 from ..bases.baseasset import BaseAsset
+from ..utilities.requests import json_loads
 from ..utilities.shared import ClientSharedObject
 
 
@@ -48,7 +49,7 @@ class BasePlace(BaseAsset):
                 "startIndex": start_index
             }
         )
-        instances_data = instances_response.json()
+        instances_data = json_loads(instances_response.content)
         return GameInstances(
             shared=self._shared,
             data=instances_data
@@ -17,6 +17,8 @@ class BaseRole(BaseItem):
         id: The role ID.
     """
 
+    __slots__ = ("_shared", "id")
+
     def __init__(self, shared: ClientSharedObject, role_id: int):
         """
         Arguments:
@@ -13,6 +13,7 @@ if TYPE_CHECKING:
     from ..badges import Badge
 
 from .baseitem import BaseItem
+from ..utilities.requests import json_loads
 from ..utilities.shared import ClientSharedObject
 from ..utilities.iterators import PageIterator
 from ..gamepasses import GamePass
@@ -24,6 +25,8 @@ class UniverseLiveStats:
     Represents a universe's live stats.
     """
 
+    __slots__ = ("total_player_count", "game_count", "player_counts_by_device_type", "__weakref__")
+
     def __init__(self, data: dict):
         self.total_player_count: int = data["totalPlayerCount"]
         self.game_count: int = data["gameCount"]
@@ -49,6 +52,12 @@ class BaseUniverse(BaseItem):
         id: The universe ID.
     """
 
+    __slots__ = ("_shared", "id", "_games_url")
+
+    favorite_count_cache_ttl: float = 30
+    live_stats_cache_ttl: float = 5
+    social_links_cache_ttl: float = 300
+
     def __init__(self, shared: ClientSharedObject, universe_id: int):
         """
         Arguments:
@@ -58,18 +67,28 @@ class BaseUniverse(BaseItem):
 
         self._shared: ClientSharedObject = shared
         self.id: int = universe_id
+        self._games_url: str = shared.url_generator.get_url("games", f"v1/games/{universe_id}")
 
     async def get_favorite_count(self) -> int:
         """
         Grabs the universe's favorite count.
+        Responses are cached for `favorite_count_cache_ttl` seconds.
 
         Returns:
             The universe's favorite count.
         """
-        favorite_count_response = await self._shared.requests.get(
-            url=self._shared.url_generator.get_url("games", f"v1/games/{self.id}/favorites/count")
-        )
-        favorite_count_data = favorite_count_response.json()
+        favorite_count_url = f"{self._games_url}/favorites/count"
+        favorite_count_data = self._shared.response_cache.get(favorite_count_url)
+
+        if favorite_count_data is None:
+            favorite_count_response = await self._shared.requests.get(
+                url=favorite_count_url
+            )
+            favorite_count_data = json_loads(favorite_count_response.content)
+            self._shared.response_cache.set(
+                favorite_count_url, favorite_count_data, ttl=self.favorite_count_cache_ttl
+            )
+
         return favorite_count_data["favoritesCount"]
 
     async def is_favorited(self) -> bool:
@@ -80,9 +99,9 @@ class BaseUniverse(BaseItem):
             Whether the authenticated user has favorited this game.
         """
         is_favorited_response = await self._shared.requests.get(
-            url=self._shared.url_generator.get_url("games", f"v1/games/{self.id}/favorites")
+            url=f"{self._games_url}/favorites"
         )
-        is_favorited_data = is_favorited_response.json()
+        is_favorited_data = json_loads(is_favorited_response.content)
         return is_favorited_data["isFavorited"]
 
     def get_badges(self, limit: int = 10) -> PageIterator:
@@ -101,11 +120,18 @@ class BaseUniverse(BaseItem):
         """
         Gets the universe's live stats.
         This data does not update live. These are just the stats that are shown on the website's live stats display.
+        Responses are cached for `live_stats_cache_ttl` seconds.
         """
-        stats_response = await self._shared.requests.get(
-            url=self._shared.url_generator.get_url("develop", f"v1/universes/{self.id}/live-stats")
-        )
-        stats_data = stats_response.json()
+        stats_url = self._shared.url_generator.get_url("develop", f"v1/universes/{self.id}/live-stats")
+        stats_data = self._shared.response_cache.get(stats_url)
+
+        if stats_data is None:
+            stats_response = await self._shared.requests.get(
+                url=stats_url
+            )
+            stats_data = json_loads(stats_response.content)
+            self._shared.response_cache.set(stats_url, stats_data, ttl=self.live_stats_cache_ttl)
+
         return UniverseLiveStats(data=stats_data)
 
     def get_gamepasses(self, limit: int = 10) -> PageIterator:
@@ -115,7 +141,7 @@ class BaseUniverse(BaseItem):
 
         return PageIterator(
             shared=self._shared,
-            url=self._shared.url_generator.get_url("games", f"v1/games/{self.id}/game-passes"),
+            url=f"{self._games_url}/game-passes",
             limit=limit,
             handler=_gamepasses_handler,
         )
@@ -124,13 +150,20 @@ class BaseUniverse(BaseItem):
         """
 
         Gets a universe's social links;
+        Responses are cached for `social_links_cache_ttl` seconds.
 
         Returns: A list of the universe's social links.
 
         """
 
-        links_response = await self._shared.requests.get(
-            url=self._shared.url_generator.get_url("games", f"v1/games/{self.id}/social-links/list")
-        )
-        links_data = links_response.json()["data"]
+        links_url = f"{self._games_url}/social-links/list"
+        links_data = self._shared.response_cache.get(links_url)
+
+        if links_data is None:
+            links_response = await self._shared.requests.get(
+                url=links_url
+            )
+            links_data = json_loads(links_response.content)["data"]
+            self._shared.response_cache.set(links_url, links_data, ttl=self.social_links_cache_ttl)
+
         return [UniverseSocialLink(shared=self._shared, data=link_data) for link_data in links_data]
@@ -18,6 +18,7 @@ from ..presence import Presence
 from ..promotionchannels import UserPromotionChannels
 from ..robloxbadges import RobloxBadge
 from ..utilities.iterators import PageIterator, SortOrder
+from ..utilities.requests import json_loads
 from ..utilities.shared import ClientSharedObject
 
 if TYPE_CHECKING:
@@ -56,7 +57,7 @@ class BaseUser(BaseItem):
                 "users", f"/v1/users/{self.id}/status"
             )
         )
-        status_data = status_response.json()
+        status_data = json_loads(status_response.content)
         return status_data["status"]
 
     def username_history(
@@ -103,7 +104,7 @@ class BaseUser(BaseItem):
         friends_response = await self._shared.requests.get(
             url=self._shared.url_generator.get_url("friends", f"v1/users/{self.id}/friends")
         )
-        friends_data = friends_response.json()["data"]
+        friends_data = json_loads(friends_response.content)["data"]
         return [Friend(shared=self._shared, data=friend_data) for friend_data in friends_data]
 
     async def get_currency(self) -> int:
@@ -118,7 +119,7 @@ class BaseUser(BaseItem):
         currency_response = await self._shared.requests.get(
             url=self._shared.url_generator.get_url("economy", f"v1/users/{self.id}/currency")
         )
-        currency_data = currency_response.json()
+        currency_data = json_loads(currency_response.content)
         return currency_data["robux"]
 
     async def has_premium(self) -> bool:
@@ -153,7 +154,7 @@ class BaseUser(BaseItem):
         instance_response = await self._shared.requests.get(
             url=self._shared.url_generator.get_url("inventory", f"v1/users/{self.id}/items/{item_type}/{item_id}")
         )
-        instance_data = instance_response.json()["data"]
+        instance_data = json_loads(instance_response.content)["data"]
         if len(instance_data) > 0:
             return item_class(
                 shared=self._shared,
@@ -193,7 +194,7 @@ class BaseUser(BaseItem):
                 "badgeIds": [badge.id for badge in badges]
             }
         )
-        awarded_data: list = awarded_response.json()["data"]
+        awarded_data: list = json_loads(awarded_response.content)["data"]
         return [
             PartialBadge(
                 shared=self._shared,
@@ -212,7 +213,7 @@ class BaseUser(BaseItem):
         roles_response = await self._shared.requests.get(
             url=self._shared.url_generator.get_url("groups", f"v1/users/{self.id}/groups/roles")
         )
-        roles_data = roles_response.json()["data"]
+        roles_data = json_loads(roles_response.content)["data"]
         return [
             Role(
                 shared=self._shared,
@@ -234,7 +235,7 @@ class BaseUser(BaseItem):
         badges_response = await self._shared.requests.get(
             url=self._shared.url_generator.get_url("accountinformation", f"v1/users/{self.id}/roblox-badges")
         )
-        badges_data = badges_response.json()
+        badges_data = json_loads(badges_response.content)
         return [RobloxBadge(shared=self._shared, data=badge_data) for badge_data in badges_data]
 
     async def get_promotion_channels(self) -> UserPromotionChannels:
@@ -246,7 +247,7 @@ class BaseUser(BaseItem):
         channels_response = await self._shared.requests.get(
             url=self._shared.url_generator.get_url("accountinformation", f"v1/users/{self.id}/promotion-channels")
         )
-        channels_data = channels_response.json()
+        channels_data = json_loads(channels_response.content)
         return UserPromotionChannels(
             data=channels_data
         )
@@ -255,7 +256,7 @@ class BaseUser(BaseItem):
         count_response = await self._shared.requests.get(
             url=self._shared.url_generator.get_url("friends", f"v1/users/{self.id}/{channel}/count")
         )
-        return count_response.json()["count"]
+        return json_loads(count_response.content)["count"]
 
     def _get_friend_channel_iterator(
             self,
@@ -6,6 +6,7 @@ Contains classes relating to the Roblox chat.
 
 from .conversations import Conversation
 from .utilities.iterators import PageNumberIterator
+from .utilities.requests import json_loads
 from .utilities.shared import ClientSharedObject
 
 
@@ -57,7 +58,7 @@ class ChatProvider:
         unread_response = await self._shared.requests.get(
             url=self._shared.url_generator.get_url("chat", "v2/get-unread-conversation-count")
         )
-        unread_data = unread_response.json()
+        unread_data = json_loads(unread_response.content)
         return unread_data["count"]
 
     async def get_settings(self) -> ChatSettings:
@@ -70,7 +71,7 @@ class ChatProvider:
         settings_response = await self._shared.requests.get(
             url=self._shared.url_generator.get_url("chat", "v2/chat-settings")
         )
-        settings_data = settings_response.json()
+        settings_data = json_loads(settings_response.content)
         return ChatSettings(data=settings_data)
 
     def get_user_conversations(self):
@@ -4,7 +4,7 @@ Contains the Client, which is the core object at the center of all ro.py applica
 
 """
 
-from typing import Union, Optional, List
+from typing import Union, Optional, List, Iterable
 
 # Bases
 from .bases.baseuser import BaseUser
@@ -37,7 +37,7 @@ from .assets import EconomyAsset
 
 # Utilities
 from .utilities.url import URLGenerator
-from .utilities.requests import Requests
+from .utilities.requests import Requests, json_loads
 from .utilities.iterators import PageIterator
 from .utilities.shared import ClientSharedObject
 
@@ -95,6 +95,31 @@ class Client:
     def __repr__(self):
         return f"<{self.__class__.__name__}>"
 
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Closes the client's session. The client should not be used to send requests after this is called.
+        """
+        await self._requests.close()
+
+    async def warm_up(self, subdomains: Iterable[str] = ("groups", "games", "develop", "badges")) -> None:
+        """
+        Connects to the passed Roblox subdomains ahead of time so the first request to each of them doesn't have to
+        wait for DNS resolution and the TCP and TLS handshakes.
+        To avoid waiting on this, run it in the background with `asyncio.create_task(client.warm_up())`.
+
+        Arguments:
+            subdomains: The subdomains to connect to.
+        """
+        await self._requests.warm_up(
+            self._url_generator.get_url(subdomain) for subdomain in subdomains
+        )
+
     # Authentication
     def set_token(self, token: str) -> None:
         """
@@ -106,6 +131,8 @@ class Client:
 
         """
         self._requests.session.cookies[".ROBLOSECURITY"] = token
+        # cached responses may depend on who was authenticated
+        self._shared.response_cache.clear()
 
     # Users
     async def get_user(self, user_id: int) -> User:
@@ -121,7 +148,7 @@ class Client:
         user_response = await self._requests.get(
             url=self._shared.url_generator.get_url("users", f"v1/users/{user_id}")
         )
-        user_data = user_response.json()
+        user_data = json_loads(user_response.content)
         return User(shared=self._shared, data=user_data)
 
     async def get_authenticated_user(
@@ -139,7 +166,7 @@ class Client:
         authenticated_user_response = await self._requests.get(
             url=self._shared.url_generator.get_url("users", f"v1/users/authenticated")
         )
-        authenticated_user_data = authenticated_user_response.json()
+        authenticated_user_data = json_loads(authenticated_user_response.content)
 
         if expand:
             return await self.get_user(authenticated_user_data["id"])
@@ -167,7 +194,7 @@ class Client:
             url=self._shared.url_generator.get_url("users", f"v1/users"),
             json={"userIds": user_ids, "excludeBannedUsers": exclude_banned_users},
         )
-        users_data = users_response.json()["data"]
+        users_data = json_loads(users_response.content)["data"]
 
         if expand:
             return [await self.get_user(user_data["id"]) for user_data in users_data]
@@ -198,7 +225,7 @@ class Client:
             url=self._shared.url_generator.get_url("users", f"v1/usernames/users"),
             json={"usernames": usernames, "excludeBannedUsers": exclude_banned_users},
         )
-        users_data = users_response.json()["data"]
+        users_data = json_loads(users_response.content)["data"]
 
         if expand:
             return [await self.get_user(user_data["id"]) for user_data in users_data]
@@ -281,7 +308,7 @@ class Client:
         group_response = await self._requests.get(
             url=self._shared.url_generator.get_url("groups", f"v1/groups/{group_id}")
         )
-        group_data = group_response.json()
+        group_data = json_loads(group_response.content)
         return Group(shared=self._shared, data=group_data)
 
     def get_base_group(self, group_id: int) -> BaseGroup:
@@ -315,7 +342,7 @@ class Client:
             url=self._shared.url_generator.get_url("games", "v1/games"),
             params={"universeIds": universe_ids},
         )
-        universes_data = universes_response.json()["data"]
+        universes_data = json_loads(universes_response.content)["data"]
         return [
             Universe(shared=self._shared, data=universe_data)
             for universe_data in universes_data
@@ -370,7 +397,7 @@ class Client:
             ),
             params={"placeIds": place_ids},
         )
-        places_data = places_response.json()
+        places_data = json_loads(places_response.content)
         return [
             Place(shared=self._shared, data=place_data) for place_data in places_data
         ]
@@ -423,7 +450,7 @@ class Client:
                 "economy", f"v2/assets/{asset_id}/details"
             )
         )
-        asset_data = asset_response.json()
+        asset_data = json_loads(asset_response.content)
         return EconomyAsset(shared=self._shared, data=asset_data)
 
     def get_base_asset(self, asset_id: int) -> BaseAsset:
@@ -461,7 +488,7 @@ class Client:
                 "pluginIds": plugin_ids
             }
         )
-        plugins_data = plugins_response.json()["data"]
+        plugins_data = json_loads(plugins_response.content)["data"]
         return [Plugin(shared=self._shared, data=plugin_data) for plugin_data in plugins_data]
 
     async def get_plugin(self, plugin_id: int) -> Optional[Plugin]:
@@ -512,7 +539,7 @@ class Client:
                 "badges", f"v1/badges/{badge_id}"
             )
         )
-        badge_data = badge_response.json()
+        badge_data = json_loads(badge_response.content)
         return Badge(shared=self._shared, data=badge_data)
 
     def get_base_badge(self, badge_id: int) -> BaseBadge:
@@ -10,11 +10,10 @@ from datetime import datetime
 from enum import Enum
 from typing import List, Optional
 
-from dateutil.parser import parse
-
 from .bases.baseconversation import BaseConversation
 from .partials.partialuniverse import ChatPartialUniverse
 from .partials.partialuser import PartialUser
+from .utilities.dates import parse_datetime
 from .utilities.shared import ClientSharedObject
 
 
@@ -94,7 +93,7 @@ class Conversation(BaseConversation):
         self.conversation_title: ConversationTitle = ConversationTitle(
             data=data["conversationTitle"]
         )
-        self.last_updated: datetime = parse(data["lastUpdated"])
+        self.last_updated: datetime = parse_datetime(data["lastUpdated"])
         self.conversation_universe: Optional[ChatPartialUniverse] = data[
                                                                         "conversationUniverse"] and ChatPartialUniverse(
             shared=shared,
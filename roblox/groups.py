@@ -9,6 +9,7 @@ from typing import Optional, Tuple
 from .bases.basegroup import BaseGroup
 from .partials.partialuser import PartialUser
 from .shout import Shout
+from .utilities.requests import json_loads
 from .utilities.shared import ClientSharedObject
 
 
@@ -64,19 +65,19 @@ class Group(BaseGroup):
             update_self: Whether to update self.shout automatically.
         """
         shout_response = await self._requests.patch(
-            url=self._shared.url_generator.get_url("groups", f"v1/groups/{self.id}/status"),
+            url=f"{self._group_url}/status",
             json={
                 "message": message
             }
         )
 
-        shout_data = shout_response.json()
+        shout_data = json_loads(shout_response.content)
 
         old_shout: Optional[Shout] = self.shout
-        new_shout: Optional[Shout] = shout_data and Shout(
+        new_shout: Optional[Shout] = Shout(
             shared=self._shared,
             data=shout_data
-        ) or None
+        ) if shout_data else None
 
         if update_self:
             self.shout = new_shout
@@ -6,9 +6,8 @@ This file contains partial objects related to Roblox badges.
 
 from datetime import datetime
 
-from dateutil.parser import parse
-
 from ..bases.basebadge import BaseBadge
+from ..utilities.dates import parse_datetime
 from ..utilities.shared import ClientSharedObject
 
 
@@ -34,7 +33,7 @@ class PartialBadge(BaseBadge):
 
         super().__init__(shared=shared, badge_id=self.id)
 
-        self.awarded: datetime = parse(data["awardedDate"])
+        self.awarded: datetime = parse_datetime(data["awardedDate"])
 
     def __repr__(self):
         return f"<{self.__class__.__name__} id={self.id} awarded={self.awarded}>"
@@ -6,9 +6,8 @@ This module contains classes intended to parse and deal with data from Roblox pl
 
 from datetime import datetime
 
-from dateutil.parser import parse
-
 from .bases.baseplugin import BasePlugin
+from .utilities.dates import parse_datetime
 from .utilities.shared import ClientSharedObject
 
 
@@ -40,8 +39,8 @@ class Plugin(BasePlugin):
         self.description: str = data["description"]
         self.comments_enabled: bool = data["commentsEnabled"]
         self.version_id: int = data["versionId"]
-        self.created: datetime = parse(data["created"])
-        self.updated: datetime = parse(data["updated"])
+        self.created: datetime = parse_datetime(data["created"])
+        self.updated: datetime = parse_datetime(data["updated"])
 
     def __repr__(self):
         return f"<{self.__class__.__name__} id={self.id} name={self.name!r}>"
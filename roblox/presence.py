@@ -7,10 +7,10 @@ This module contains classes intended to parse and deal with data from Roblox pr
 from datetime import datetime
 from typing import Optional, List
 
-from dateutil.parser import parse
-
 from .bases.baseplace import BasePlace
 from .bases.baseuniverse import BaseUniverse
+from .utilities.dates import parse_datetime
+from .utilities.requests import json_loads
 from .utilities.shared import ClientSharedObject
 
 
@@ -62,7 +62,7 @@ class Presence:
         )
 
         self.user_id: int = data["userId"]
-        self.last_online: datetime = parse(data["lastOnline"])
+        self.last_online: datetime = parse_datetime(data["lastOnline"])
 
     def __repr__(self):
         return f"<{self.__class__.__name__} user_presence_type={self.user_presence_type}>"
@@ -96,5 +96,5 @@ class PresenceProvider:
                 "userIds": user_ids
             }
         )
-        presences_data = presences_response.json()["userPresences"]
+        presences_data = json_loads(presences_response.content)["userPresences"]
         return [Presence(shared=self._shared, data=presence_data) for presence_data in presences_data]
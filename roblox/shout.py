@@ -6,9 +6,8 @@ Contains the Shout object, which represents a group's shout.
 
 from datetime import datetime
 
-from dateutil.parser import parse
-
 from .partials.partialuser import PartialUser
+from .utilities.dates import parse_datetime
 from .utilities.shared import ClientSharedObject
 
 
@@ -37,8 +36,8 @@ class Shout:
         self._shared: ClientSharedObject = shared
 
         self.body: str = data["body"]
-        self.created: datetime = parse(data["created"])
-        self.updated: datetime = parse(data["updated"])
+        self.created: datetime = parse_datetime(data["created"])
+        self.updated: datetime = parse_datetime(data["updated"])
         self.poster: PartialUser = PartialUser(
             shared=self._shared,
             data=data["poster"]
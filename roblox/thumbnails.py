@@ -15,6 +15,7 @@ from .bases.baseplace import BasePlace
 from .bases.baseuniverse import BaseUniverse
 from .bases.baseuser import BaseUser
 from .threedthumbnails import ThreeDThumbnail
+from .utilities.requests import json_loads
 from .utilities.shared import ClientSharedObject
 
 AssetOrAssetId = Union[BaseAsset, int]
@@ -104,7 +105,7 @@ class Thumbnail:
         threed_response = await self._shared.requests.get(
             url=self.image_url
         )
-        threed_data = threed_response.json()
+        threed_data = json_loads(threed_response.content)
         return ThreeDThumbnail(
             shared=self._shared,
             data=threed_data
@@ -187,7 +188,7 @@ class ThumbnailProvider:
                 "isCircular": is_circular,
             },
         )
-        thumbnails_data = thumbnails_response.json()["data"]
+        thumbnails_data = json_loads(thumbnails_response.content)["data"]
         return [
             Thumbnail(shared=self._shared, data=thumbnail_data)
             for thumbnail_data in thumbnails_data
@@ -209,7 +210,7 @@ class ThumbnailProvider:
             ),
             params={"assetId": int(asset)},
         )
-        thumbnail_data = thumbnail_response.json()
+        thumbnail_data = json_loads(thumbnail_response.content)
         return Thumbnail(shared=self._shared, data=thumbnail_data)
 
     async def get_badge_icons(
@@ -240,7 +241,7 @@ class ThumbnailProvider:
                 "isCircular": is_circular,
             },
         )
-        thumbnails_data = thumbnails_response.json()["data"]
+        thumbnails_data = json_loads(thumbnails_response.content)["data"]
         return [
             Thumbnail(shared=self._shared, data=thumbnail_data)
             for thumbnail_data in thumbnails_data
@@ -275,7 +276,7 @@ class ThumbnailProvider:
                 "isCircular": is_circular,
             },
         )
-        thumbnails_data = thumbnails_response.json()["data"]
+        thumbnails_data = json_loads(thumbnails_response.content)["data"]
         return [
             Thumbnail(shared=self._shared, data=thumbnail_data)
             for thumbnail_data in thumbnails_data
@@ -312,7 +313,7 @@ class ThumbnailProvider:
                 "isCircular": is_circular,
             },
         )
-        thumbnails_data = thumbnails_response.json()["data"]
+        thumbnails_data = json_loads(thumbnails_response.content)["data"]
         return [
             Thumbnail(shared=self._shared, data=thumbnail_data)
             for thumbnail_data in thumbnails_data
@@ -354,7 +355,7 @@ class ThumbnailProvider:
                 "isCircular": is_circular,
             },
         )
-        thumbnails_data = thumbnails_response.json()["data"]
+        thumbnails_data = json_loads(thumbnails_response.content)["data"]
         return [
             UniverseThumbnails(shared=self._shared, data=thumbnail_data)
             for thumbnail_data in thumbnails_data
@@ -388,7 +389,7 @@ class ThumbnailProvider:
                 "isCircular": is_circular,
             },
         )
-        thumbnails_data = thumbnails_response.json()["data"]
+        thumbnails_data = json_loads(thumbnails_response.content)["data"]
         return [
             Thumbnail(shared=self._shared, data=thumbnail_data)
             for thumbnail_data in thumbnails_data
@@ -424,7 +425,7 @@ class ThumbnailProvider:
                 "isCircular": is_circular,
             },
         )
-        thumbnails_data = thumbnails_response.json()["data"]
+        thumbnails_data = json_loads(thumbnails_response.content)["data"]
         return [
             Thumbnail(shared=self._shared, data=thumbnail_data)
             for thumbnail_data in thumbnails_data
@@ -474,7 +475,7 @@ class ThumbnailProvider:
             },
         )
 
-        thumbnails_data = thumbnails_response.json()["data"]
+        thumbnails_data = json_loads(thumbnails_response.content)["data"]
         return [
             Thumbnail(shared=self._shared, data=thumbnail_data)
             for thumbnail_data in thumbnails_data
@@ -495,5 +496,5 @@ class ThumbnailProvider:
             url=self._shared.url_generator.get_url("thumbnails", "v1/users/avatar-3d"),
             params={"userId": int(user)},
         )
-        thumbnail_data = thumbnail_response.json()
+        thumbnail_data = json_loads(thumbnail_response.content)
         return Thumbnail(shared=self._shared, data=thumbnail_data)
@@ -8,12 +8,11 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional, List, Union
 
-from dateutil.parser import parse
-
 from .bases.baseuniverse import BaseUniverse
 from .partials.partialgroup import UniversePartialGroup
 from .partials.partialuser import PartialUser
 from .creatortype import CreatorType
+from .utilities.dates import parse_datetime
 from .utilities.shared import ClientSharedObject
 
 
@@ -111,8 +110,8 @@ class Universe(BaseUniverse):
         self.playing: int = data["playing"]
         self.visits: int = data["visits"]
         self.max_players: int = data["maxPlayers"]
-        self.created: datetime = parse(data["created"])
-        self.updated: datetime = parse(data["updated"])
+        self.created: datetime = parse_datetime(data["created"])
+        self.updated: datetime = parse_datetime(data["updated"])
         self.studio_access_to_apis_allowed: bool = data["studioAccessToApisAllowed"]
         self.create_vip_servers_allowed: bool = data["createVipServersAllowed"]
         self.universe_avatar_type: UniverseAvatarType = UniverseAvatarType(data["universeAvatarType"])
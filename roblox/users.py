@@ -6,9 +6,8 @@ This module contains classes intended to parse and deal with data from Roblox us
 
 from datetime import datetime
 
-from dateutil.parser import parse
-
 from .bases.baseuser import BaseUser
+from .utilities.dates import parse_datetime
 from .utilities.shared import ClientSharedObject
 
 
@@ -44,7 +43,7 @@ class User(BaseUser):
         self.id: int = data["id"]
         self.is_banned: bool = data["isBanned"]
         self.description: str = data["description"]
-        self.created: datetime = parse(data["created"])
+        self.created: datetime = parse_datetime(data["created"])
 
     def __repr__(self):
         return f"<{self.__class__.__name__} id={self.id} name={self.name!r} display_name={self.display_name!r}>"
@@ -0,0 +1,80 @@
+"""
+
+This module contains the TTLCache, which is used internally by ro.py to avoid re-requesting data that rarely changes.
+
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    A bounded, least-recently-used cache whose entries expire after a set amount of time.
+
+    Attributes:
+        max_size: The maximum amount of entries to store before evicting the least recently used one.
+        ttl: The default amount of seconds an entry stays valid for.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 60):
+        """
+        Arguments:
+            max_size: The maximum amount of entries to store before evicting the least recently used one.
+            ttl: The default amount of seconds an entry stays valid for.
+        """
+        self.max_size: int = max_size
+        self.ttl: float = ttl
+        self._entries: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Returns the value stored at this key, or None if it is missing or expired.
+
+        Arguments:
+            key: The key to look up.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires, value = entry
+        if monotonic() >= expires:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Stores a value at this key.
+
+        Arguments:
+            key: The key to store the value at.
+            value: The value to store.
+            ttl: How many seconds this entry stays valid for. Defaults to the cache's TTL.
+        """
+        self._entries[key] = (monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """
+        Removes the entry stored at this key, if there is one.
+
+        Arguments:
+            key: The key to remove.
+        """
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Removes every entry from the cache.
+        """
+        self._entries.clear()
@@ -0,0 +1,35 @@
+"""
+
+This module contains functions used internally by ro.py to parse timestamps returned by Roblox endpoints.
+
+"""
+
+import re
+import sys
+from datetime import datetime
+
+_fraction_pattern = re.compile(r"\.(\d+)")
+
+
+def _normalize_timestamp(timestamp: str) -> str:
+    # Older versions of fromisoformat only accept a numeric UTC offset and exactly 3 or 6 fractional digits,
+    # while Roblox returns a trailing Z and anywhere from 1 to 7 fractional digits.
+    if timestamp.endswith("Z"):
+        timestamp = timestamp[:-1] + "+00:00"
+    return _fraction_pattern.sub(lambda match: "." + match.group(1)[:6].ljust(6, "0"), timestamp, count=1)
+
+
+def parse_datetime(timestamp: str) -> datetime:
+    """
+    Parses an ISO 8601 timestamp, as returned by Roblox endpoints, into a datetime.
+
+    Arguments:
+        timestamp: The timestamp to parse.
+
+    Returns:
+        A datetime.
+    """
+    if sys.version_info >= (3, 11):
+        return datetime.fromisoformat(timestamp)
+
+    return datetime.fromisoformat(_normalize_timestamp(timestamp))
@@ -6,13 +6,22 @@ This module contains iterators used internally by ro.py to provide paginated inf
 
 from __future__ import annotations
 
+import asyncio
 from enum import Enum
-from typing import Callable, Optional, AsyncIterator
+from functools import partial
+from typing import Callable, Optional, AsyncIterator, List, Iterator as TypingIterator
 
 from .exceptions import NoMoreItems
+from .requests import json_loads
 from .shared import ClientSharedObject
 
 
+def _retrieve_exception(task: asyncio.Task) -> None:
+    # a prefetched page may never be awaited if iteration stops early, so mark its exception as retrieved
+    if not task.cancelled():
+        task.exception()
+
+
 class SortOrder(Enum):
     """
     Order in which page data should load in.
@@ -29,36 +38,30 @@ class IteratorItems(AsyncIterator):
 
     def __init__(self, iterator: Iterator):
         self._iterator = iterator
-        self._position: int = 0
-        self._items: list = []
+        self._items = iter(())
 
     def __aiter__(self):
-        self._position = 0
-        self._items = []
+        self._items = iter(())
         return self
 
     async def __anext__(self):
-        if self._position == len(self._items):
-            # we are at the end of our current page of items. start again with a new page
-            self._position = 0
-            try:
-                # get new items
-                self._items = await self._iterator.next()
-            except NoMoreItems:
-                # if there aren't any more items, reset and break the loop
-                self._position = 0
-                self._items = []
-                raise StopAsyncIteration
+        try:
+            return next(self._items)
+        except StopIteration:
+            pass
 
-        # if we got here we know there are more items
+        # we are at the end of our current page of items. start again with a new page
         try:
-            item = self._items[self._position]
-        except IndexError:
+            self._items = await self._iterator._next_items()
+        except NoMoreItems:
+            # if there aren't any more items, break the loop
+            raise StopAsyncIteration
+
+        try:
+            return next(self._items)
+        except StopIteration:
             # edge case for group roles
             raise StopAsyncIteration
-        # we advance the iterator by one for the next iteration
-        self._position += 1
-        return item
 
 
 class IteratorPages(AsyncIterator):
@@ -86,8 +89,9 @@ class Iterator:
     """
 
     def __init__(self):
-        self._items = IteratorItems(self)
-        self._pages = IteratorPages(self)
+        # most iterators are only used one way, so these are created when first requested
+        self._items: Optional[IteratorItems] = None
+        self._pages: Optional[IteratorPages] = None
 
     async def next(self):
         """
@@ -96,6 +100,21 @@ class Iterator:
 
         raise NotImplementedError
 
+    async def aclose(self) -> None:
+        """
+        Stops any work the iterator is doing in the background.
+        Call this if you stop iterating before reaching the last page.
+        """
+
+        pass
+
+    async def _next_items(self) -> TypingIterator:
+        """
+        Moves to the next page and returns an iterator over that page's items.
+        """
+
+        return iter(await self.next())
+
     async def flatten(self) -> list:
         """
         Flattens the data into a list.
@@ -113,22 +132,109 @@ class Iterator:
         return items
 
     def __aiter__(self):
-        return self._items
+        return self.items()
 
     def items(self) -> IteratorItems:
         """
         Returns an AsyncIterable containing each iterator item.
         """
+        if self._items is None:
+            self._items = IteratorItems(self)
         return self._items
 
     def pages(self) -> IteratorPages:
         """
         Returns an AsyncIterable containing each iterator page. Each page is a list of items.
         """
+        if self._pages is None:
+            self._pages = IteratorPages(self)
         return self._pages
 
 
-class PageIterator(Iterator):
+class _EndpointIterator(Iterator):
+    """
+    Base for iterators that request their pages from a Roblox endpoint.
+    The request parameters and handler are read when the first page is requested, so changing them after that has
+    no effect.
+    """
+
+    def __init__(
+            self,
+            shared: ClientSharedObject,
+            url: str,
+            extra_parameters: Optional[dict] = None,
+            handler: Optional[Callable] = None,
+            handler_kwargs: Optional[dict] = None
+    ):
+        super().__init__()
+
+        self._shared: ClientSharedObject = shared
+
+        self.url: str = url
+        self.extra_parameters: dict = extra_parameters or {}
+        self.handler: Callable = handler
+        self.handler_kwargs: dict = handler_kwargs or {}
+
+        self._handler_call: Optional[Callable] = None
+        self._params_base: Optional[dict] = None
+
+    def _fixed_parameters(self) -> dict:
+        """
+        Returns the parameters sent with every page request, besides extra_parameters.
+        """
+
+        raise NotImplementedError
+
+    def _prepare(self) -> None:
+        if self._params_base is not None:
+            return
+
+        # handlers take (shared, data), so everything but the data is bound once instead of on every item
+        self._handler_call = self.handler and partial(self.handler, self._shared, **self.handler_kwargs)
+        self._params_base = {
+            **self._fixed_parameters(),
+            **self.extra_parameters
+        }
+
+    async def _get_page(self, **parameters):
+        self._prepare()
+
+        params = self._params_base.copy()
+        params.update(parameters)
+
+        page_response = await self._shared.requests.get(
+            url=self.url,
+            params=params
+        )
+        return json_loads(page_response.content)
+
+    async def _next_raw(self) -> list:
+        """
+        Moves to the next page and returns that page's data before it is passed to the handler.
+        """
+
+        raise NotImplementedError
+
+    def _handle_page(self, data: list) -> list:
+        if self._handler_call:
+            data = list(map(self._handler_call, data))
+
+        return data
+
+    async def next(self):
+        """
+        Advances the iterator to the next page.
+        """
+        return self._handle_page(await self._next_raw())
+
+    async def _next_items(self) -> TypingIterator:
+        data = await self._next_raw()
+
+        # items are only handled as they are consumed, so we never build a list of the whole page
+        return map(self._handler_call, data) if self._handler_call else iter(data)
+
+
+class PageIterator(_EndpointIterator):
     """
     Represents a cursor-based, paginated Roblox object.
     For more information about how cursor-based pagination works, see https://robloxapi.wiki/wiki/Pagination.
@@ -145,7 +251,9 @@ class PageIterator(Iterator):
         limit: How much data should be returned per-page.
         extra_parameters: Extra parameters to pass to the endpoint.
         handler: A callable object to use to convert raw endpoint data to parsed objects.
+            It is called with the ClientSharedObject and the raw item data as positional arguments.
         handler_kwargs: Extra keyword arguments to pass to the handler.
+        prefetch: Whether to request the next page in the background as soon as the current page arrives.
         next_cursor: Cursor to use to advance to the next page.
         previous_cursor: Cursor to use to advance to the previous page.
         iterator_position: What position in the iterator_items the iterator is currently at.
@@ -160,7 +268,8 @@ class PageIterator(Iterator):
             limit: int = 10,
             extra_parameters: Optional[dict] = None,
             handler: Optional[Callable] = None,
-            handler_kwargs: Optional[dict] = None
+            handler_kwargs: Optional[dict] = None,
+            prefetch: bool = False
     ):
         """
         Parameters:
@@ -170,21 +279,24 @@ class PageIterator(Iterator):
             limit: How much data should be returned per-page.
             extra_parameters: Extra parameters to pass to the endpoint.
             handler: A callable object to use to convert raw endpoint data to parsed objects.
+                It is called with the ClientSharedObject and the raw item data as positional arguments.
             handler_kwargs: Extra keyword arguments to pass to the handler.
+            prefetch: Whether to request the next page in the background as soon as the current page arrives.
+                If you stop iterating before the last page, call aclose to cancel that request.
         """
 
-        super().__init__()
-
-        self._shared: ClientSharedObject = shared
+        super().__init__(
+            shared=shared,
+            url=url,
+            extra_parameters=extra_parameters,
+            handler=handler,
+            handler_kwargs=handler_kwargs
+        )
 
         # store some basic arguments in the object
-        self.url: str = url
         self.sort_order: SortOrder = sort_order
         self.limit: int = limit
-
-        self.extra_parameters: dict = extra_parameters or {}
-        self.handler: Callable = handler
-        self.handler_kwargs: dict = handler_kwargs or {}
+        self.prefetch: bool = prefetch
 
         # cursors to use for next, previous
         self.next_cursor: str = ""
@@ -195,10 +307,16 @@ class PageIterator(Iterator):
         self.iterator_items: list = []
         self.next_started: bool = False
 
-    async def next(self):
-        """
-        Advances the iterator to the next page.
-        """
+        # in-flight request for the next page, only used when prefetching
+        self._prefetch_task: Optional[asyncio.Task] = None
+
+    def _fixed_parameters(self) -> dict:
+        return {
+            "limit": self.limit,
+            "sortOrder": self.sort_order.value
+        }
+
+    async def _next_raw(self) -> list:
         if self.next_started and not self.next_cursor:
             # if we just started and there is no cursor
             # this is the last page, because we can go back but not forward
@@ -208,36 +326,34 @@ class PageIterator(Iterator):
         if not self.next_started:
             self.next_started = True
 
-        page_response = await self._shared.requests.get(
-            url=self.url,
-            params={
-                "cursor": self.next_cursor,
-                "limit": self.limit,
-                "sortOrder": self.sort_order.value,
-                **self.extra_parameters
-            }
-        )
-        page_data = page_response.json()
+        if self._prefetch_task:
+            # the request for this page was already sent when the last page came in
+            # clear it first so that if it failed, the next call retries the same cursor with a new request
+            prefetch_task, self._prefetch_task = self._prefetch_task, None
+            page_data = await prefetch_task
+        else:
+            page_data = await self._get_page(cursor=self.next_cursor)
 
         # fill in cursors
         self.next_cursor = page_data["nextPageCursor"]
         self.previous_cursor = page_data["previousPageCursor"]
 
-        data = page_data["data"]
+        if self.prefetch and self.next_cursor:
+            self._prefetch_task = asyncio.ensure_future(self._get_page(cursor=self.next_cursor))
+            self._prefetch_task.add_done_callback(_retrieve_exception)
 
-        if self.handler:
-            data = [
-                self.handler(
-                    shared=self._shared,
-                    data=item_data,
-                    **self.handler_kwargs
-                ) for item_data in data
-            ]
+        return page_data["data"]
 
-        return data
+    async def aclose(self) -> None:
+        """
+        Cancels the request for the next page if one was prefetched.
+        """
+        if self._prefetch_task:
+            self._prefetch_task.cancel()
+            self._prefetch_task = None
 
 
-class PageNumberIterator(Iterator):
+class PageNumberIterator(_EndpointIterator):
     """
     Represents an iterator that is advanced with page numbers and sizes, like those seen on chat.roblox.com.
     """
@@ -251,47 +367,57 @@ class PageNumberIterator(Iterator):
             handler: Optional[Callable] = None,
             handler_kwargs: Optional[dict] = None
     ):
-        super().__init__()
-
-        self._shared: ClientSharedObject = shared
+        super().__init__(
+            shared=shared,
+            url=url,
+            extra_parameters=extra_parameters,
+            handler=handler,
+            handler_kwargs=handler_kwargs
+        )
 
-        self.url: str = url
         self.page_number: int = 1
         self.page_size: int = page_size
 
-        self.extra_parameters: dict = extra_parameters or {}
-        self.handler: Callable = handler
-        self.handler_kwargs: dict = handler_kwargs or {}
-
         self.iterator_position = 0
         self.iterator_items = []
 
-    async def next(self):
-        """
-        Advances the iterator to the next page.
-        """
-        page_response = await self._shared.requests.get(
-            url=self.url,
-            params={
-                "pageNumber": self.page_number,
-                "pageSize": self.page_size,
-                **self.extra_parameters
-            }
-        )
-        data = page_response.json()
+    def _fixed_parameters(self) -> dict:
+        return {
+            "pageSize": self.page_size
+        }
+
+    async def _next_raw(self) -> list:
+        data = await self._get_page(pageNumber=self.page_number)
 
         if len(data) == 0:
             raise NoMoreItems("No more items.")
 
         self.page_number += 1
 
-        if self.handler:
-            data = [
-                self.handler(
-                    shared=self._shared,
-                    data=item_data,
-                    **self.handler_kwargs
-                ) for item_data in data
-            ]
-
         return data
+
+    async def flatten_parallel(self, concurrency: int = 8) -> list:
+        """
+        Flattens the data into a list, requesting up to `concurrency` pages at a time.
+
+        Arguments:
+            concurrency: How many pages to request at once.
+        """
+
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1.")
+
+        items: list = []
+
+        while True:
+            pages: List[list] = await asyncio.gather(*[
+                self._get_page(pageNumber=page_number)
+                for page_number in range(self.page_number, self.page_number + concurrency)
+            ])
+
+            for data in pages:
+                if len(data) == 0:
+                    return items
+
+                self.page_number += 1
+                items += self._handle_page(data)
@@ -8,22 +8,43 @@ from __future__ import annotations
 
 import asyncio
 from json import JSONDecodeError
-from typing import Optional
+from typing import Iterable, Optional
 
-from httpx import AsyncClient, Response
+from httpx import AsyncClient, Limits, Response
 
 from .exceptions import get_exception_from_status_code
 from ..utilities.url import URLGenerator
 
+# json_loads decodes with orjson when it is installed. Decode responses with json_loads(response.content) rather than
+# response.json() so that every response benefits from it.
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+
+default_limits = Limits(
+    max_connections=100,
+    max_keepalive_connections=32,
+    # Roblox drops idle connections after about 60 seconds, so we expire ours slightly earlier to avoid
+    # sending requests on sockets that have already been closed on the other end.
+    keepalive_expiry=55
+)
+
 
 class CleanAsyncClient(AsyncClient):
     """
     This is a clean-on-delete version of httpx.AsyncClient.
+    One of these is created per Requests object and its connection pool is reused for every request.
 
     """
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, limits: Limits = default_limits):
+        """
+        Arguments:
+            limits: Connection pool limits for this client.
+        """
+        super().__init__(limits=limits)
 
     def __del__(self):
         try:
@@ -75,6 +96,25 @@ class Requests:
         self.session.headers["User-Agent"] = "Roblox/WinInet"
         self.session.headers["Referer"] = "www.roblox.com"
 
+    async def close(self) -> None:
+        """
+        Closes the underlying session and every connection in its pool.
+        """
+        await self.session.aclose()
+
+    async def warm_up(self, urls: Iterable[str]) -> None:
+        """
+        Opens a pooled connection to each URL's host ahead of time by sending a HEAD request to it.
+        Failures are ignored, as this is only an optimization.
+
+        Arguments:
+            urls: URLs on the hosts to connect to.
+        """
+        await asyncio.gather(
+            *[self.session.head(url) for url in urls],
+            return_exceptions=True
+        )
+
     async def request(self, method: str, *args, **kwargs) -> Response:
         """
         Arguments:
@@ -110,7 +150,7 @@ class Requests:
             if content_type and content_type.startswith("application/json"):
                 data = None
                 try:
-                    data = response.json()
+                    data = json_loads(response.content)
                 except JSONDecodeError:
                     pass
                 errors = data and data.get("errors")
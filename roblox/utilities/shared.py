@@ -8,6 +8,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Optional
 
+from .cache import TTLCache
 from .requests import Requests
 from .url import URLGenerator
 
@@ -33,6 +34,8 @@ class ClientSharedObject:
         delivery_provider: provider for all delivery stuff
         chat_provider: provider for chat
         account_provider: provider for account
+        username_cache: cache of users looked up by username, keyed by (lowercase username, exclude_banned_users)
+        response_cache: cache of decoded responses from slow-changing endpoints, keyed by URL
     """
 
     def __init__(self, client: Client, requests: Requests, url_generator: URLGenerator):
@@ -50,3 +53,5 @@ class ClientSharedObject:
         self.delivery_provider: Optional[DeliveryProvider] = None
         self.chat_provider: Optional[ChatProvider] = None
         self.account_provider: Optional[AccountProvider] = None
+        self.username_cache: TTLCache = TTLCache(max_size=1024, ttl=300)
+        self.response_cache: TTLCache = TTLCache(max_size=4096, ttl=30)
@@ -7,9 +7,8 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional, Union, TYPE_CHECKING
 
-from dateutil.parser import parse
-
 from .members import Member
+from .utilities.dates import parse_datetime
 from .utilities.shared import ClientSharedObject
 
 if TYPE_CHECKING:
@@ -76,8 +75,8 @@ class WallPost(WallPostRelationship):
             group=self.group
         ) or None
         self.body: str = data["body"]
-        self.created: datetime = parse(data["created"])
-        self.updated: datetime = parse(data["updated"])
+        self.created: datetime = parse_datetime(data["created"])
+        self.updated: datetime = parse_datetime(data["updated"])
 
     def __repr__(self):
         return f"<{self.__class__.__name__} id={self.id} body={self.body!r} group={self.group}>"
@@ -30,9 +30,13 @@ setup_info = {
     },
     "python_requires": '>=3.7',
     "install_requires": [
-        "httpx",
-        "python-dateutil"
-    ]
+        "httpx"
+    ],
+    "extras_require": {
+        "speed": [
+            "orjson"
+        ]
+    }
 }
 
 
@@ -0,0 +1,27 @@
+"""
+
+Shared fixtures for ro.py's offline tests.
+These replace the client's transport so that no requests are sent to Roblox.
+
+"""
+
+from typing import Callable
+
+import httpx
+import pytest
+
+from roblox import Client
+
+
+@pytest.fixture
+def make_client() -> Callable[[Callable[[httpx.Request], httpx.Response]], Client]:
+    """
+    Returns a function that creates a Client whose requests are answered by the passed handler.
+    """
+
+    def _make_client(handler: Callable[[httpx.Request], httpx.Response]) -> Client:
+        client = Client()
+        client.requests.session._transport = httpx.MockTransport(handler)
+        return client
+
+    return _make_client
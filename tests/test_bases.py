@@ -0,0 +1,50 @@
+"""
+
+Tests the slotted base objects.
+
+"""
+
+import weakref
+
+import pytest
+
+from roblox import Client
+from roblox.bases.basegroup import GroupSettings
+from roblox.bases.baserole import BaseRole
+from roblox.bases.baseuniverse import UniverseLiveStats
+
+client = Client()
+
+settings_data = {
+    "isApprovalRequired": True,
+    "isBuildersClubRequired": False,
+    "areEnemiesAllowed": False,
+    "areGroupFundsVisible": True,
+    "areGroupGamesVisible": True,
+    "isGroupNameChangeEnabled": False,
+    "canChangeGroupName": False
+}
+
+live_stats_data = {
+    "totalPlayerCount": 10,
+    "gameCount": 2,
+    "playerCountsByDeviceType": {"Computer": 10}
+}
+
+slotted_objects = [
+    client.get_base_group(1),
+    client.get_base_universe(1),
+    BaseRole(shared=client._shared, role_id=1),
+    GroupSettings(shared=client._shared, data=settings_data),
+    UniverseLiveStats(data=live_stats_data)
+]
+
+
+@pytest.mark.parametrize("item", slotted_objects, ids=lambda item: type(item).__name__)
+def test_slotted_objects_have_no_dict(item):
+    assert not hasattr(item, "__dict__")
+
+
+@pytest.mark.parametrize("item", slotted_objects, ids=lambda item: type(item).__name__)
+def test_slotted_objects_support_weak_references(item):
+    assert weakref.ref(item)() is item
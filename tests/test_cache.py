@@ -0,0 +1,133 @@
+"""
+
+Tests the TTLCache and the caches built on it in BaseGroup.
+
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from roblox.bases import basegroup
+from roblox.utilities import cache
+from roblox.utilities.cache import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """
+    Replaces the clock used by TTLCache and the group roles cache with one that only moves when told to.
+    """
+
+    class Clock:
+        now: float = 0
+
+    monkeypatch.setattr(cache, "monotonic", lambda: Clock.now)
+    monkeypatch.setattr(basegroup, "monotonic", lambda: Clock.now)
+    return Clock
+
+
+def test_get_missing():
+    assert TTLCache().get("missing") is None
+
+
+def test_expiry(clock):
+    ttl_cache = TTLCache(ttl=10)
+    ttl_cache.set("default", 1)
+    ttl_cache.set("custom", 2, ttl=20)
+
+    clock.now = 9
+    assert ttl_cache.get("default") == 1
+
+    clock.now = 10
+    assert ttl_cache.get("default") is None
+    assert ttl_cache.get("custom") == 2
+
+    clock.now = 20
+    assert ttl_cache.get("custom") is None
+
+
+def test_lru_eviction():
+    ttl_cache = TTLCache(max_size=2)
+    ttl_cache.set("a", 1)
+    ttl_cache.set("b", 2)
+
+    # reading "a" makes "b" the least recently used entry
+    assert ttl_cache.get("a") == 1
+    ttl_cache.set("c", 3)
+
+    assert ttl_cache.get("a") == 1
+    assert ttl_cache.get("b") is None
+    assert ttl_cache.get("c") == 3
+
+
+def test_pop_and_clear():
+    ttl_cache = TTLCache()
+    ttl_cache.set("a", 1)
+    ttl_cache.set("b", 2)
+
+    ttl_cache.pop("a")
+    ttl_cache.pop("missing")
+    assert ttl_cache.get("a") is None
+    assert ttl_cache.get("b") == 2
+
+    ttl_cache.clear()
+    assert ttl_cache.get("b") is None
+
+
+class RecordingHandler:
+    """
+    Answers group role and username requests and records every request path.
+    """
+
+    def __init__(self):
+        self.paths = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.paths.append(request.url.path)
+        if request.url.path.endswith("/roles"):
+            return httpx.Response(200, json={"roles": [{"id": 5, "name": "Member", "rank": 1, "memberCount": 1}]})
+        if request.url.path == "/v1/usernames/users":
+            return httpx.Response(200, json={
+                "data": [{"id": 9, "name": "Builderman", "displayName": "Builderman", "requestedUsername": "builderman"}]
+            })
+        return httpx.Response(200, json={})
+
+
+def test_roles_cache(make_client, clock):
+    handler = RecordingHandler()
+    client = make_client(handler)
+    group = client.get_base_group(1)
+
+    async def main():
+        await group.set_rank(client.get_base_user(2), 1)
+        await group.set_rank(client.get_base_user(3), 1)
+        assert handler.paths.count("/v1/groups/1/roles") == 1
+
+        group.invalidate_roles()
+        await group.get_roles()
+        assert handler.paths.count("/v1/groups/1/roles") == 2
+
+        clock.now = group.roles_cache_ttl
+        await group.get_roles()
+        assert handler.paths.count("/v1/groups/1/roles") == 3
+
+    asyncio.run(main())
+
+
+def test_username_cache(make_client):
+    handler = RecordingHandler()
+    client = make_client(handler)
+    group = client.get_base_group(1)
+
+    async def main():
+        first = await group.get_member_by_username("Builderman")
+        second = await group.get_member_by_username("builderman")
+        assert first.id == second.id == 9
+        assert handler.paths.count("/v1/usernames/users") == 1
+
+        await group.get_member_by_username("builderman", exclude_banned_users=True)
+        assert handler.paths.count("/v1/usernames/users") == 2
+
+    asyncio.run(main())
@@ -0,0 +1,38 @@
+"""
+
+Tests timestamp parsing in roblox.utilities.dates.
+
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from roblox.utilities import dates
+from roblox.utilities.dates import parse_datetime
+
+timestamps = [
+    ("2020-01-02T03:04:05.1Z", datetime(2020, 1, 2, 3, 4, 5, 100000, tzinfo=timezone.utc)),
+    ("2020-01-02T03:04:05.12Z", datetime(2020, 1, 2, 3, 4, 5, 120000, tzinfo=timezone.utc)),
+    ("2020-01-02T03:04:05.123Z", datetime(2020, 1, 2, 3, 4, 5, 123000, tzinfo=timezone.utc)),
+    ("2020-01-02T03:04:05.1234567Z", datetime(2020, 1, 2, 3, 4, 5, 123456, tzinfo=timezone.utc)),
+    ("2020-01-02T03:04:05Z", datetime(2020, 1, 2, 3, 4, 5, tzinfo=timezone.utc)),
+    ("2020-01-02T03:04:05.123-05:00", datetime(2020, 1, 2, 3, 4, 5, 123000, tzinfo=timezone(timedelta(hours=-5)))),
+    ("2020-01-02T03:04:05.12", datetime(2020, 1, 2, 3, 4, 5, 120000)),
+    ("2020-01-02T03:04:05", datetime(2020, 1, 2, 3, 4, 5)),
+]
+
+
+@pytest.mark.parametrize("timestamp, expected", timestamps)
+def test_parse_datetime(timestamp, expected):
+    parsed = parse_datetime(timestamp)
+    assert parsed == expected
+    assert parsed.utcoffset() == expected.utcoffset()
+
+
+@pytest.mark.parametrize("timestamp, expected", timestamps)
+def test_normalized_timestamp(timestamp, expected):
+    # this is the path taken by parse_datetime before Python 3.11, so test it on every version
+    parsed = datetime.fromisoformat(dates._normalize_timestamp(timestamp))
+    assert parsed == expected
+    assert parsed.utcoffset() == expected.utcoffset()
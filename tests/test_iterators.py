@@ -0,0 +1,155 @@
+"""
+
+Tests the paginated iterators in roblox.utilities.iterators.
+
+"""
+
+import asyncio
+import gc
+
+import httpx
+import pytest
+
+from roblox.utilities.exceptions import InternalServerError, NoMoreItems
+from roblox.utilities.iterators import Iterator, PageIterator, PageNumberIterator
+
+
+def cursor_pages(request: httpx.Request) -> httpx.Response:
+    cursor = int(request.url.params.get("cursor") or 0)
+    if cursor == 1:
+        return httpx.Response(500)
+    return httpx.Response(200, json={
+        "data": [{"page": cursor}],
+        "nextPageCursor": str(cursor + 1),
+        "previousPageCursor": None
+    })
+
+
+def numbered_pages(request: httpx.Request) -> httpx.Response:
+    page_number = int(request.url.params["pageNumber"])
+    return httpx.Response(200, json=[{"page": page_number}] if page_number <= 5 else [])
+
+
+def test_flatten_parallel(make_client):
+    client = make_client(numbered_pages)
+    iterator = PageNumberIterator(shared=client._shared, url="https://chat.roblox.com/pages")
+
+    items = asyncio.run(iterator.flatten_parallel(concurrency=2))
+
+    assert [item["page"] for item in items] == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.parametrize("concurrency", [0, -1])
+def test_flatten_parallel_rejects_invalid_concurrency(make_client, concurrency):
+    client = make_client(numbered_pages)
+    iterator = PageNumberIterator(shared=client._shared, url="https://chat.roblox.com/pages")
+
+    with pytest.raises(ValueError):
+        asyncio.run(iterator.flatten_parallel(concurrency=concurrency))
+
+
+def test_prefetch_early_break(make_client):
+    client = make_client(cursor_pages)
+    unhandled = []
+
+    async def main():
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: unhandled.append(context))
+
+        iterator = PageIterator(shared=client._shared, url="https://groups.roblox.com/pages", prefetch=True)
+        async for item in iterator:
+            assert item == {"page": 0}
+            break
+
+        # let the prefetched request fail, then drop the iterator without awaiting it
+        await asyncio.wait([iterator._prefetch_task])
+        del iterator
+
+        # unretrieved task exceptions are reported when the task is collected
+        gc.collect()
+
+    asyncio.run(main())
+
+    assert unhandled == []
+
+
+def test_prefetch_retry_after_failure(make_client):
+    requested_cursors = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        cursor = request.url.params["cursor"]
+        requested_cursors.append(cursor)
+        if cursor == "1" and requested_cursors.count("1") == 1:
+            return httpx.Response(500)
+        return httpx.Response(200, json={
+            "data": [{"page": int(cursor or 0)}],
+            "nextPageCursor": None if cursor == "1" else "1",
+            "previousPageCursor": None
+        })
+
+    client = make_client(handler)
+    iterator = PageIterator(shared=client._shared, url="https://groups.roblox.com/pages", prefetch=True)
+
+    async def main():
+        assert await iterator.next() == [{"page": 0}]
+
+        with pytest.raises(InternalServerError):
+            await iterator.next()
+
+        assert await iterator.next() == [{"page": 1}]
+
+    asyncio.run(main())
+
+    assert requested_cursors == ["", "1", "1"]
+
+
+def test_aclose_cancels_prefetch(make_client):
+    client = make_client(cursor_pages)
+    iterator = PageIterator(shared=client._shared, url="https://groups.roblox.com/pages", prefetch=True)
+
+    async def main():
+        await iterator.next()
+        prefetch_task = iterator._prefetch_task
+        await iterator.aclose()
+        await asyncio.sleep(0)
+        return prefetch_task
+
+    assert asyncio.run(main()).cancelled()
+
+
+def test_settings_changed_before_first_page(make_client):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"data": [{"id": 1}], "nextPageCursor": None, "previousPageCursor": None})
+
+    client = make_client(handler)
+    iterator = PageIterator(shared=client._shared, url="https://groups.roblox.com/pages")
+    iterator.limit = 100
+    iterator.extra_parameters["filter"] = "all"
+    iterator.handler = lambda shared, data, prefix: f"{prefix}{data['id']}"
+    iterator.handler_kwargs = {"prefix": "item "}
+
+    assert asyncio.run(iterator.flatten()) == ["item 1"]
+    assert requests[0].url.params["limit"] == "100"
+    assert requests[0].url.params["filter"] == "all"
+    assert requests[0].url.params["sortOrder"] == "Asc"
+
+
+def test_custom_iterator_items_are_handled_once():
+    class DoublingIterator(Iterator):
+        def __init__(self):
+            super().__init__()
+            self._handler_call = lambda data: data * 2
+            self.pages_left = 2
+
+        async def next(self):
+            if not self.pages_left:
+                raise NoMoreItems("No more items.")
+            self.pages_left -= 1
+            return [self._handler_call(number) for number in (1, 2)]
+
+    async def main():
+        return [item async for item in DoublingIterator()]
+
+    assert asyncio.run(main()) == [2, 4, 2, 4]
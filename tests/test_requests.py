@@ -0,0 +1,33 @@
+"""
+
+Tests the Requests object in roblox.utilities.requests.
+
+"""
+
+import asyncio
+
+import httpx
+
+from roblox.utilities.requests import CleanAsyncClient, Requests, json_loads
+
+
+class CustomResponse(httpx.Response):
+    pass
+
+
+class CustomClient(CleanAsyncClient):
+    """
+    A session that returns its own Response subclass, like a custom session passed to Requests might.
+    """
+
+    async def request(self, method, url, *args, **kwargs):
+        return CustomResponse(200, json={"id": 1}, request=httpx.Request(method, url))
+
+
+def test_custom_session_response_is_returned_unchanged():
+    requests = Requests(session=CustomClient())
+
+    response = asyncio.run(requests.get("https://users.roblox.com/v1/users/1"))
+
+    assert type(response) is CustomResponse
+    assert json_loads(response.content) == {"id": 1}